@@ -0,0 +1,42 @@
+import json
+import os
+
+# Paths answered directly at the ASGI layer (liveness probes).
+HEALTH_PATHS = {"/health", "/api/status/live"}
+
+_ENV = os.getenv("ENV", "development").lower()
+# same compact encoding FastAPI uses for the /health route
+_CACHED_BODY = json.dumps({"status": "ok", "env": _ENV}, separators=(",", ":")).encode()
+_HEADERS = [
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_CACHED_BODY)).encode()),
+]
+
+
+class HealthCheckInterceptor:
+    """
+    Pure ASGI wrapper that answers liveness probes with a precomputed body,
+    skipping routing, middleware (CORS) and dependency injection.
+    Every other request is passed through to the wrapped app.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] not in HEALTH_PATHS:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            await send({
+                "type": "http.response.start",
+                "status": 405,
+                "headers": [(b"allow", b"GET, HEAD"), (b"content-length", b"0")],
+            })
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        await send({"type": "http.response.start", "status": 200, "headers": _HEADERS})
+        await send({"type": "http.response.body", "body": _CACHED_BODY if method == "GET" else b""})
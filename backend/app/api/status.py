@@ -1,26 +1,57 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from fastapi import APIRouter, Request
+from fastapi.concurrency import run_in_threadpool
 from typing import Optional
+import asyncio
 import time
 
-from db.database import SessionLocal
+from db.database import engine
 
 router = APIRouter()
 
+# cap on each DB round trip so a hung database can't hang the probe
+_DB_TIMEOUT = 5
+
+# process start, for uptime_seconds (monotonic: unaffected by wall-clock changes)
+_STARTED_AT = time.monotonic()
+
+# version() is constant for the server's lifetime; cache it briefly so probes only ping
+_VERSION_TTL = 30.0
+_VERSION_CACHE = {"value": None, "expires": 0.0}
+_VERSION_LOCK = asyncio.Lock()
+
+
+def _scalar_sync(sql: str):
+    """Run one query on the sync engine (fallback when there's no asyncpg pool)."""
+    with engine.connect() as conn:
+        return conn.exec_driver_sql(sql).scalar()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+
+async def _db_version(fetch_version) -> Optional[str]:
+    """
+    Return the cached DB version string, refreshing it at most once per TTL.
+    fetch_version is an awaitable factory that runs SELECT version().
+    """
+    if time.monotonic() < _VERSION_CACHE["expires"]:
+        return _VERSION_CACHE["value"]
+    async with _VERSION_LOCK:
+        # another request may have refreshed it while we waited
+        if time.monotonic() < _VERSION_CACHE["expires"]:
+            return _VERSION_CACHE["value"]
+        version = await fetch_version()
+        _VERSION_CACHE["value"] = str(version) if version is not None else None
+        _VERSION_CACHE["expires"] = time.monotonic() + _VERSION_TTL
+        return _VERSION_CACHE["value"]
 
 
 @router.get("/status", tags=["Status"], summary="Backend + Database status")
-def status(db: Session = Depends(get_db)):
+async def status(request: Request):
     """
     Returns a simple status object describing backend and DB health.
+    uptime_seconds is the time since this process loaded the module
+    (it used to be the current wall-clock timestamp).
+    The DB check runs on the app's asyncpg pool (app.state.pg), so it
+    doesn't tie up a threadpool worker; without a pool (non-Postgres DB, or
+    the pool failed to open) it falls back to the sync engine in the threadpool.
 
     Response JSON structure:
     {
@@ -34,28 +65,29 @@ def status(db: Session = Depends(get_db)):
     """
     # backend is running if this handler executes
     backend_state = "ok"
-    uptime_seconds: Optional[float] = None
-
-    # optional simple uptime (you can replace with app start time if available)
-    try:
-        uptime_seconds = time.time()  # placeholder (client doesn't need exact uptime)
-    except Exception:
-        uptime_seconds = None
+    uptime_seconds = time.monotonic() - _STARTED_AT
 
     # test DB connectivity with a very small query
     db_ok = False
     db_details: Optional[str] = None
     try:
-        # simple SELECT 1 to check connectivity
-        db.execute(text("SELECT 1"))
-        # try to get a version string (Postgres)
-        try:
-            row = db.execute(text("SELECT version()")).fetchone()
-            if row:
-                db_details = str(row[0])
-        except Exception:
-            # if version() fails for any reason, ignore — connectivity is the main check
-            db_details = None
+        pool = getattr(request.app.state, "pg", None)
+        if pool is not None:
+            async with pool.acquire(timeout=_DB_TIMEOUT) as con:
+                # simple SELECT 1 to check connectivity (asyncpg keeps it prepared per connection)
+                await con.fetchval("SELECT 1", timeout=_DB_TIMEOUT)
+                # try to get a version string (Postgres), cached for _VERSION_TTL seconds
+                try:
+                    db_details = await _db_version(lambda: con.fetchval("SELECT version()", timeout=_DB_TIMEOUT))
+                except Exception:
+                    # if version() fails for any reason, ignore — connectivity is the main check
+                    db_details = None
+        else:
+            await run_in_threadpool(_scalar_sync, "SELECT 1")
+            try:
+                db_details = await _db_version(lambda: run_in_threadpool(_scalar_sync, "SELECT version()"))
+            except Exception:
+                db_details = None
         db_ok = True
     except Exception as e:
         db_ok = False
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -11,7 +11,25 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set")
 
-engine = create_engine(DATABASE_URL)
+_url = make_url(DATABASE_URL)
+
+# pre_ping drops dead connections before use; recycle avoids server-side idle timeouts.
+# Pool sizing only applies to QueuePool (Postgres); e.g. in-memory SQLite rejects it.
+_pool_kwargs = {"pool_size": 10, "max_overflow": 20} if _url.get_backend_name() == "postgresql" else {}
+engine = create_engine(
+    DATABASE_URL,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+    **_pool_kwargs,
+)
+
+# asyncpg DSN for the non-blocking status check (None when not on Postgres)
+ASYNCPG_DSN = (
+    _url.set(drivername="postgresql").render_as_string(hide_password=False)
+    if _url.get_backend_name() == "postgresql"
+    else None
+)
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
@@ -1,30 +1,55 @@
 import os
+import json
 import logging
 import secrets
+from contextlib import asynccontextmanager
+
+import asyncpg
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.openapi.docs import get_swagger_ui_html, get_redoc_html
 
 # routers
 from api import orders, status
+from api.health_interceptor import HealthCheckInterceptor
 
 # database imports
-from db.database import engine
+from db.database import engine, ASYNCPG_DSN
 from db.models import Base as ModelsBase
 
 # Create tables
 ModelsBase.metadata.create_all(bind=engine)
 
+logger = logging.getLogger(__name__)
+
 # Environment
 ENV = os.getenv("ENV", "development").lower()
 DOCS_USER = os.getenv("DOCS_USER")
 DOCS_PASSWORD = os.getenv("DOCS_PASSWORD")
 ENABLE_DOCS_IN_DEV = os.getenv("ENABLE_DOCS", "true").lower() == "true"
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the small asyncpg pool used by /api/status (non-blocking DB check)."""
+    app.state.pg = None
+    if ASYNCPG_DSN:
+        try:
+            app.state.pg = await asyncpg.create_pool(ASYNCPG_DSN, min_size=1, max_size=4)
+        except Exception:
+            # only the status check uses this pool; it falls back to the sync engine
+            logger.exception("Could not open asyncpg pool for /api/status; using the sync engine")
+    try:
+        yield
+    finally:
+        if app.state.pg is not None:
+            await app.state.pg.close()
+
+
 # App created with docs disabled by default; we'll mount protected docs routes manually
-app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+fastapi_app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None, lifespan=lifespan)
 
 # CORS config: set ALLOWED_ORIGINS comma-separated in env or default to localhost in dev
 allowed_origins_env = os.getenv("ALLOWED_ORIGINS", "")
@@ -33,7 +58,7 @@ if allowed_origins_env:
 else:
     origins = ["http://localhost:3000"] if ENV != "production" else []
 
-app.add_middleware(
+fastapi_app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
@@ -83,32 +108,46 @@ async def require_docs_auth(credentials: HTTPBasicCredentials = Depends(security
 
 # --- Custom docs routes (protected) ---
 # note: include_in_schema=False so these routes don't show up in other docs
-@app.get("/docs", include_in_schema=False)
+@fastapi_app.get("/docs", include_in_schema=False)
 async def swagger_ui_secure(_=Depends(require_docs_auth)):
     """
     Serve Swagger UI. Access will be controlled by require_docs_auth.
     """
     # Swagger UI will fetch /openapi.json (we also protect that route)
-    return get_swagger_ui_html(openapi_url="/openapi.json", title="API Docs")
+    return HTMLResponse(_SWAGGER_HTML)
 
-@app.get("/openapi.json", include_in_schema=False)
+@fastapi_app.get("/openapi.json", include_in_schema=False)
 async def openapi_secure(_=Depends(require_docs_auth)):
     """
     Serve the OpenAPI JSON (also protected).
     """
-    return JSONResponse(app.openapi())
+    return Response(content=_OPENAPI_BYTES, media_type="application/json")
 
-@app.get("/redoc", include_in_schema=False)
+@fastapi_app.get("/redoc", include_in_schema=False)
 async def redoc_secure(_=Depends(require_docs_auth)):
     """
     Serve ReDoc (also protected).
     """
-    return get_redoc_html(openapi_url="/openapi.json", title="ReDoc")
+    return HTMLResponse(_REDOC_HTML)
 
-app.include_router(orders.router, prefix="/api")
-app.include_router(status.router, prefix="/api")
+fastapi_app.include_router(orders.router, prefix="/api")
+fastapi_app.include_router(status.router, prefix="/api")
 
 # Public health endpoint (no auth)
-@app.get("/health", tags=["health"])
+@fastapi_app.get("/health", tags=["health"])
 def health():
+    # normally answered by HealthCheckInterceptor; kept for the schema and for tests using fastapi_app
     return {"status": "ok", "env": ENV}
+
+
+# The schema and docs pages are fixed once all routes are registered: render them once
+# (same compact encoding JSONResponse would produce) instead of on every request.
+_OPENAPI_BYTES = json.dumps(
+    fastapi_app.openapi(), ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")
+).encode("utf-8")
+_SWAGGER_HTML = get_swagger_ui_html(openapi_url="/openapi.json", title="API Docs").body
+_REDOC_HTML = get_redoc_html(openapi_url="/openapi.json", title="ReDoc").body
+
+
+# ASGI entrypoint (uvicorn main:app): liveness probes short-circuit before routing/CORS
+app = HealthCheckInterceptor(fastapi_app)